@@ -1,14 +1,122 @@
+import functools
 import time
 import logging
-import xml.etree.ElementTree as ET
 import re
+from collections import OrderedDict
+from typing import Optional
 import aiohttp
 import asyncio
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson不可用时回退到标准库
+    import json
+    _json_loads = json.loads
+
+try:
+    from lxml import etree as ET
+except ImportError:  # lxml不可用时回退到标准库
+    import xml.etree.ElementTree as ET
 
 logger = logging.getLogger(__name__)
 
+# 时间字符串清洗与解析
+_TIME_SANITIZE_RE = re.compile(r'[^0-9.:]')
+_TIME_PARSE_RE = re.compile(r'^(?:(\d+):)?(?:(\d+):)?(\d+)(?:\.(\d*))?$')
+
+# 搜索请求的固定参数，调用时仅补充term
+_SEARCH_SONGS_PARAMS = {
+    'art[music-videos:url]': 'c',
+    'art[url]': 'f',
+    'extend': 'artistUrl',
+    'relate[albums]': 'artists',
+    'fields[artists]': 'url,name,artwork',
+    'format[resources]': 'map',
+    'include[albums]': 'artists',
+    'include[music-videos]': 'artists',
+    'include[songs]': 'artists,lyrics,syllable-lyrics',
+    'include[stations]': 'radio-show',
+    'l': 'zh-Hans-CN',
+    'limit': '21',
+    'omit[resource]': 'autos',
+    'platform': 'web',
+    'relate[songs]': 'albums',
+    'types': 'activities,albums,apple-curators,artists,curators,editorial-items,music-movies,music-videos,playlists,record-labels,songs,stations,tv-episodes,uploaded-videos',
+    'with': 'lyricHighlights,lyrics,serverBubbles'
+}
+_SEARCH_PARAMS = {**_SEARCH_SONGS_PARAMS, 'include[songs]': 'artists'}
+
+# 播放列表请求的固定查询字符串（已编码）
+_PLAYLIST_QUERY = "art%5Burl%5D=f&extend=editorialArtwork%2CeditorialVideo%2Coffers%2CseoDescription%2CseoTitle%2CtrackCount&fields%5Balbums%5D=name%2Cartwork%2CplayParams%2Curl&fields%5Bapple-curators%5D=name%2Curl&fields%5Bartists%5D=name%2Cartwork%2Curl&fields%5Bcurators%5D=name%2Curl&fields%5Bsongs%5D=name%2CartistName%2CcuratorName%2CcomposerName%2Cartwork%2CplayParams%2CcontentRating%2CalbumName%2Curl%2CdurationInMillis%2CaudioTraits%2CextendedAssetUrls&format%5Bresources%5D=map&include=tracks%2Ccurator&include%5Bmusic-videos%5D=artists&include%5Bsongs%5D=artists&l=zh-Hans-CN&limit%5Btracks%5D=300&limit%5Bview.featured-artists%5D=15&limit%5Bview.more-by-curator%5D=15&omit%5Bresource%5D=autos&platform=web&views=featured-artists%2Cmore-by-curator"
+
+# 带TTML命名空间的属性名
+_NS_TIMING = '{http://music.apple.com/lyric-ttml-internal}timing'
+_NS_SONGPART = '{http://music.apple.com/lyric-ttml-internal}songPart'
+
+
+@functools.lru_cache(maxsize=4096)
+def to_standard_time(time: str) -> str:
+    """
+    将时间转换为标准格式
+    47.243 -> 00:47.243
+    04:24.638 -> 04:24.638
+    1:2:3.4 -> 62:03.400
+    """
+    # 只保留数字、小数点、冒号
+    _time = _TIME_SANITIZE_RE.sub('', time)
+    match = _TIME_PARSE_RE.match(_time)
+    if match is None:
+        raise ValueError(f"无法解析的时间格式: {time}")
+
+    first, second, seconds, ms_str = match.groups()
+    if second is not None:
+        # 时:分:秒
+        hours = int(first)
+        minutes = int(second)
+    else:
+        # 分:秒 或 秒
+        hours = 0
+        minutes = int(first) if first is not None else 0
+    seconds = int(seconds)
+    # 毫秒补零后取前三位：.4 -> 400, .45 -> 450, .456789 -> 456
+    milliseconds = int((ms_str + '000')[:3]) if ms_str else 0
+    
+    # 处理进位
+    minutes += hours * 60
+    if seconds >= 60:
+        minutes += seconds // 60
+        seconds = seconds % 60
+        
+    return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+
+def _format_cover(artwork: dict) -> tuple:
+    """
+    生成封面URL
+    :param artwork: 原始artwork数据
+    :return: (封面格式, 封面URL)
+    """
+    cover_format = artwork.get('url', '')
+    cover_url = ''
+    if cover_format:
+        # 异常由调用方统一处理
+        cover_url = cover_format.format(w=artwork.get('width', 2000), h=artwork.get('height', 2000), c='bb', f='jpg')
+    return cover_format, cover_url
+
+
 class AppleMusicAPI:
+    # 事件循环 -> 共享实例
+    _shared: dict = {}
+    # 正在关闭的遗留实例任务，保持引用以免被回收
+    _closing: set = set()
+    # LRC缓存容量
+    lrc_cache_size = 512
+    # TTML歌词缓存容量
+    ttml_cache_size = 256
+    # 单个实例的最大并发请求数，与连接池的limit_per_host相匹配
+    max_concurrency = 16
+
     def __init__(self):
         self.authorization = ('')
         self.token = ('')
@@ -21,9 +129,55 @@ class AppleMusicAPI:
         }
         self.session = None
         self.ttml_lyric_cache = {}
+        # 歌词URL -> (TTML哈希, LRC)，按LRU淘汰
+        self.lrc_cache: OrderedDict = OrderedDict()
+        # 歌词URL -> TTML，跨请求复用，按LRU淘汰
+        self.ttml_cache: OrderedDict = OrderedDict()
+        # 限制详情与歌词请求的并发数，随session一起创建
+        self._semaphore = None
+
+    @classmethod
+    def get_shared(cls) -> "AppleMusicAPI":
+        """
+        获取当前事件循环的共享实例，使各调用方复用同一个连接池
+        session和信号量绑定事件循环，因此按正在运行的事件循环分别缓存，需在协程中调用；
+        事件循环结束前应调用close_shared()关闭连接，遗漏的实例会在下次调用时被清理并关闭
+        """
+        loop = asyncio.get_running_loop()
+        # 清理已关闭事件循环遗留的实例，并在当前事件循环中关闭其session
+        for closed_loop in [l for l in cls._shared if l.is_closed()]:
+            task = loop.create_task(cls._shared.pop(closed_loop).close())
+            cls._closing.add(task)
+            task.add_done_callback(cls._closing.discard)
+        instance = cls._shared.get(loop)
+        if instance is None:
+            instance = cls._shared[loop] = cls()
+        return instance
+
+    @classmethod
+    async def close_shared(cls):
+        """关闭并移除当前事件循环的共享实例"""
+        instance = cls._shared.pop(asyncio.get_running_loop(), None)
+        if instance is not None:
+            await instance.close()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """创建带连接池调优的session，并重建信号量使其绑定到当前事件循环"""
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        # 请求头在每次请求时传入，以便创建session后仍可修改授权信息
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=20),
+        )
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        await self.ensure_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -34,11 +188,11 @@ class AppleMusicAPI:
         """确保session已创建"""
         try:
             if self.session is None:
-                self.session = aiohttp.ClientSession()
+                self.session = self._create_session()
             # 测试会话是否可用
             elif self.session.closed:
                 logger.warning("会话已关闭，重新创建")
-                self.session = aiohttp.ClientSession()
+                self.session = self._create_session()
         except Exception as e:
             logger.error(f"创建会话时出错: {e}")
             # 强制重建会话
@@ -47,7 +201,7 @@ class AppleMusicAPI:
                     await self.session.close()
             except:
                 pass
-            self.session = aiohttp.ClientSession()
+            self.session = self._create_session()
             
     async def close(self):
         """关闭session"""
@@ -59,11 +213,11 @@ class AppleMusicAPI:
         finally:
             self.session = None
 
-    def data_parser_song(self, data: dict) -> dict:
+    def data_parser_song(self, data: dict, parse_lyrics: bool = True) -> dict:
         """
         解析音乐数据(从搜索，需要额外请求歌词)
         :param data: 原始响应数据
-        :param lyrics: 歌词数据
+        :param parse_lyrics: 是否将TTML歌词转换为LRC，为False时lrc为空字符串
         :return: 整理后的音乐数据
         """
         try:
@@ -73,33 +227,14 @@ class AppleMusicAPI:
             
             # 获取artists_id
             artists_data = relationships.get('artists', {}).get('data', [])
-            artists_id = []
-            for ar in artists_data:
-                ar_id = ar.get('id')
-                if ar_id:
-                    artists_id.append(ar_id)
+            artists_id = [ar_id for ar in artists_data if (ar_id := ar.get('id'))]
             
             # albums_id
             albums_data = relationships.get('albums', {}).get('data', [])
-            albums_id = []
-            for al in albums_data:
-                al_id = al.get('id')
-                if al_id:
-                    albums_id.append(al_id)
+            albums_id = [al_id for al in albums_data if (al_id := al.get('id'))]
             
             # 封面信息
-            artwork = attributes.get('artwork', {})
-            cover_format = artwork.get('url', '')
-            width = artwork.get('width', 2000)
-            height = artwork.get('height', 2000)
-            cover_url = ''
-            if cover_format:
-                try:
-                    cover_url = cover_format.format(w=width, h=height, f='jpg')
-                except KeyError as e:
-                    logger.error(f"封面URL格式化错误: {e}, 原格式: {cover_format}")
-                except Exception as e:
-                    logger.error(f"封面URL处理错误: {e}")
+            cover_format, cover_url = _format_cover(attributes.get('artwork', {}))
             
             # 歌词信息
             syllable_lyrics = relationships.get('syllable-lyrics', {})
@@ -111,7 +246,7 @@ class AppleMusicAPI:
                 lyrics_ttml_data = syllable_lyrics_data[0].get('attributes', {}).get('ttml', '')
             
             lrc_ttml = lyrics_ttml_data or self.ttml_lyric_cache.get(lyric_path, '')
-            lrc = self.ttml_to_lrc(lrc_ttml)
+            lrc = self.cached_ttml_to_lrc(lyric_path, lrc_ttml) if parse_lyrics else ''
             
             return {
                 "title": attributes.get('name', ''),                        # 歌曲名
@@ -136,10 +271,6 @@ class AppleMusicAPI:
                 "lrc": lrc,                                                 # 歌词LRC
                 "update_time": time.time()                                  # 更新时间
             }
-        except KeyError as e:
-            # 记录详细错误信息但不包含过长的数据内容
-            logger.error(f"解析Apple Music歌曲数据时出现KeyError: {e}, 数据ID: {data.get('id', 'unknown')}")
-            return {}
         except Exception as e:
             logger.error(f"解析Apple Music歌曲数据时出现异常: {e}, 数据ID: {data.get('id', 'unknown')}")
             return {}
@@ -153,27 +284,12 @@ class AppleMusicAPI:
         """
         try:
             attributes = data.get('attributes', {})
-            artwork = attributes.get('artwork', {})
-            cover_format = artwork.get('url', '')
-            width = artwork.get('width', 2000)
-            height = artwork.get('height', 2000)
-            cover_url = ''
-            if cover_format:
-                try:
-                    cover_url = cover_format.format(w=width, h=height, f='jpg')
-                except KeyError as e:
-                    logger.error(f"专辑封面URL格式化错误: {e}, 原格式: {cover_format}")
-                except Exception as e:
-                    logger.error(f"专辑封面URL处理错误: {e}")
+            cover_format, cover_url = _format_cover(attributes.get('artwork', {}))
 
             # 获取artists_id
             relationships = data.get('relationships', {})
             artists_data = relationships.get('artists', {}).get('data', [])
-            artists_id = []
-            for ar in artists_data:
-                ar_id = ar.get('id')
-                if ar_id:
-                    artists_id.append(ar_id)
+            artists_id = [ar_id for ar in artists_data if (ar_id := ar.get('id'))]
 
             return {
                 "album": attributes.get('name', ''),
@@ -188,9 +304,6 @@ class AppleMusicAPI:
                 "genreNames": attributes.get('genreNames', []),
                 "update_time": time.time()
             }
-        except KeyError as e:
-            logger.error(f"解析Apple Music专辑数据时出现KeyError: {e}, 数据ID: {data.get('id', 'unknown')}")
-            return {}
         except Exception as e:
             logger.error(f"解析Apple Music专辑数据时出现异常: {e}, 数据ID: {data.get('id', 'unknown')}")
             return {}
@@ -204,18 +317,7 @@ class AppleMusicAPI:
         """
         try:
             attributes = data.get('attributes', {})
-            artwork = attributes.get('artwork', {})
-            cover_format = artwork.get('url', '')
-            width = artwork.get('width', 2000)
-            height = artwork.get('height', 2000)
-            cover_url = ''
-            if cover_format:
-                try:
-                    cover_url = cover_format.format(w=width, h=height, f='jpg')
-                except KeyError as e:
-                    logger.error(f"艺术家封面URL格式化错误: {e}, 原格式: {cover_format}")
-                except Exception as e:
-                    logger.error(f"艺术家封面URL处理错误: {e}")
+            cover_format, cover_url = _format_cover(attributes.get('artwork', {}))
 
             return {
                 "name": attributes.get('name', ''),
@@ -226,64 +328,37 @@ class AppleMusicAPI:
                 "genreNames": attributes.get('genreNames', []),
                 "update_time": time.time()
             }
-        except KeyError as e:
-            logger.error(f"解析Apple Music艺术家数据时出现KeyError: {e}, 数据ID: {data.get('id', 'unknown')}")
-            return {}
         except Exception as e:
             logger.error(f"解析Apple Music艺术家数据时出现异常: {e}, 数据ID: {data.get('id', 'unknown')}")
             return {}
 
-    @staticmethod
-    def to_standard_time(time: str) -> str:
+    # 兼容原有的AppleMusicAPI.to_standard_time调用方式
+    to_standard_time = staticmethod(to_standard_time)
+    
+    def cached_ttml_to_lrc(self, lyric_path: str, ttml: str) -> str:
         """
-        将时间转换为标准格式
-        47.243 -> 00:47.243
-        04:24.638 -> 04:24.638
-        1:2:3.4 -> 62:03.400
+        按歌词URL缓存TTML转换后的LRC，TTML变化时重新解析
+        Args:
+            lyric_path: 歌词URL
+            ttml: TTML格式歌词
+        Returns:
+            str: LRC格式歌词或纯文本歌词
         """
-        # 只保留数字、小数点、冒号
-        _time = re.sub(r'[^0-9.:]', '', time)
-        times = _time.split(':')
+        if not lyric_path or not ttml:
+            return self.ttml_to_lrc(ttml)
         
-        def parse_milliseconds(ms_str: str) -> int:
-            """处理毫秒部分，根据位数调整值"""
-            if not ms_str:
-                return 0
-            # 根据毫秒的位数进行处理
-            if len(ms_str) == 1:
-                return int(ms_str) * 100    # 一位数字，如 .4 -> 400
-            elif len(ms_str) == 2:
-                return int(ms_str) * 10     # 两位数字，如 .45 -> 450
-            else:
-                return int(ms_str[:3])      # 取前三位，如 .456789 -> 456
-
-        if len(times) == 1:
-            hours = 0
-            minutes = 0
-            # 将时间字符串分割成整数和小数部分
-            seconds_parts = times[0].split('.')
-            seconds = int(seconds_parts[0])
-            milliseconds = parse_milliseconds(seconds_parts[1]) if len(seconds_parts) > 1 else 0
-        elif len(times) == 2:
-            hours = 0
-            minutes = int(times[0])
-            seconds_parts = times[1].split('.')
-            seconds = int(seconds_parts[0])
-            milliseconds = parse_milliseconds(seconds_parts[1]) if len(seconds_parts) > 1 else 0
-        elif len(times) == 3:
-            hours = int(times[0])
-            minutes = int(times[1])
-            seconds_parts = times[2].split('.')
-            seconds = int(seconds_parts[0])
-            milliseconds = parse_milliseconds(seconds_parts[1]) if len(seconds_parts) > 1 else 0
+        ttml_hash = hash(ttml)
+        cached = self.lrc_cache.get(lyric_path)
+        if cached is not None and cached[0] == ttml_hash:
+            self.lrc_cache.move_to_end(lyric_path)
+            return cached[1]
         
-        # 处理进位
-        minutes += hours * 60
-        if seconds >= 60:
-            minutes += seconds // 60
-            seconds = seconds % 60
-            
-        return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+        lrc = self.ttml_to_lrc(ttml)
+        self.lrc_cache[lyric_path] = (ttml_hash, lrc)
+        self.lrc_cache.move_to_end(lyric_path)
+        if len(self.lrc_cache) > self.lrc_cache_size:
+            self.lrc_cache.popitem(last=False)
+        return lrc
     
     def ttml_to_lrc(self, ttml: str) -> str:
         """
@@ -296,81 +371,42 @@ class AppleMusicAPI:
         if not ttml:
             return ''
         
-        # 定义TTML命名空间
-        namespaces = {
-            'tt': 'http://www.w3.org/ns/ttml',
-            'itunes': 'http://music.apple.com/lyric-ttml-internal'
-        }
+        root = ET.fromstring(ttml.encode())
         
-        root = ET.fromstring(ttml)
-        lrc_body: list = []
-        
-        # 使用命名空间查找body标签
-        body = root.find('.//tt:body', namespaces)
+        # 查找body标签（兼容有无命名空间）
+        body = root.find('.//{*}body')
         if body is None:
-            body = root.find('body')
-            if body is None:
-                logger.error("无法在TTML中找到body标签")
-                return ''
-            
+            logger.error("无法在TTML中找到body标签")
+            return ''
+        
         # 检查是否为无时间标记的歌词
-        if 'itunes:timing="None"' in ttml:
-            # 获取所有div标签
-            divs = body.findall('.//tt:div', namespaces) or body.findall('div')
-            text_lines = []
-            
-            for div in divs:
-                # 查找所有p标签
-                lines = div.findall('.//tt:p', namespaces) or div.findall('p')
-                for line in lines:
-                    # 获取<span>标签
-                    spans = line.findall('.//tt:span', namespaces) or line.findall('span')
-                    if spans:
-                        text = ''.join(line.itertext()).strip()
-                    else:
-                        text = line.text.strip() if line.text else ''
-                    if text:
-                        text_lines.append(text)
-                    
-            return "[!text]" + '\n'.join(text_lines)
+        timing = root.get(_NS_TIMING) or root.get('itunes:timing')
+        no_timing = timing == 'None'
         
-        # 获取所有div标签
-        divs = body.findall('.//tt:div', namespaces) or body.findall('div')
+        parts: list[str] = []
+        emit = parts.append
+        tst = to_standard_time
         
-        for div in divs:
-            div_itunes_songPart: str = div.get('{http://music.apple.com/lyric-ttml-internal}songPart') or div.get('itunes:songPart')
-            # 查找所有p标签
-            lines = div.findall('.//tt:p', namespaces) or div.findall('p')
-            if div_itunes_songPart:
-                lrc_body.append({
-                    'type': 'mark',
-                    'part': div_itunes_songPart
-                })
-            for line in lines:
-                line_begin: str = line.get('begin')
-                line_end: str = line.get('end')
-                # 获取<span>标签
-                spans = line.findall('.//tt:span', namespaces) or line.findall('span')
-                line_text: str = ''
-                if spans:
-                    full_text = ''.join(line.itertext()).strip()
-                    line_text = full_text
+        for div in body.iterfind('.//{*}div'):
+            if not no_timing:
+                div_itunes_songPart: str = div.get(_NS_SONGPART) or div.get('itunes:songPart')
+                if div_itunes_songPart:
+                    emit(f"[{div_itunes_songPart}]\n")
+            for line in div.iterfind('.//{*}p'):
+                # 含<span>等子节点时拼接全部文本
+                if len(line):
+                    line_text = ''.join(line.itertext()).strip()
                 else:
                     line_text = line.text.strip() if line.text else ''
-                lrc_body.append({
-                    'type': 'line',
-                    'begin': line_begin,
-                    'end': line_end,
-                    'text': line_text
-                })
-
-        lrc_text = ''
-        for item in lrc_body:
-            if item.get('type') == 'mark':
-                lrc_text += f"[{item.get('part')}]\n"
-            elif item.get('type') == 'line':
-                lrc_text += f"[{self.to_standard_time(item.get('begin'))}]{item.get('text')}\n"
-        return lrc_text
+                if no_timing:
+                    if line_text:
+                        emit(line_text)
+                else:
+                    emit(f"[{tst(line.get('begin'))}]{line_text}\n")
+        
+        if no_timing:
+            return "[!text]" + '\n'.join(parts)
+        return ''.join(parts)
     
     async def get_lyric(self, path: str) -> str:
         """获取歌曲的TTML格式歌词数据
@@ -382,16 +418,27 @@ class AppleMusicAPI:
         if not path:
             return ''
         
+        # 同一歌曲的TTML基本不变，命中缓存时无需再次请求
+        cached = self.ttml_cache.get(path)
+        if cached is not None:
+            self.ttml_cache.move_to_end(path)
+            return cached
+        
         await self.ensure_session()
         url = f"https://amp-api.music.apple.com{path}"
         params = {
             'l': 'zh-Hans-CN'
         }
         try:
-            async with self.session.get(url=url, headers=self.headers, params=params) as response:
+            async with self._semaphore, self.session.get(url=url, headers=self.headers, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return data["data"][0]["attributes"]["ttml"]
+                    data = _json_loads(await response.read())
+                    ttml = data["data"][0]["attributes"]["ttml"]
+                    if ttml:
+                        self.ttml_cache[path] = ttml
+                        if len(self.ttml_cache) > self.ttml_cache_size:
+                            self.ttml_cache.popitem(last=False)
+                    return ttml
                 else:
                     logger.error(f"获取TTML歌词失败: {response.status}")
                     return ''
@@ -406,30 +453,13 @@ class AppleMusicAPI:
         await self.ensure_session()
         url = "https://amp-api-edge.music.apple.com/v1/catalog/us/search"
         params = {
-            'art[music-videos:url]': 'c',
-            'art[url]': 'f',
-            'extend': 'artistUrl',
-            'relate[albums]': 'artistName,artistUrl,artwork,contentRating,editorialArtwork,editorialNotes,name,playParams,releaseDate,url,trackCount',
-            'fields[artists]': 'url,name,artwork',
-            'format[resources]': 'map',
-            'include[albums]': 'artists',
-            'include[music-videos]': 'artists',
-            'include[songs]': 'artists,lyrics,syllable-lyrics',
-            'include[stations]': 'radio-show',
-            'l': 'zh-Hans-CN',
-            'limit': '21',
-            'omit[resource]': 'autos',
-            'platform': 'web',
-            'relate[albums]': 'artists',
-            'relate[songs]': 'albums',
+            **_SEARCH_SONGS_PARAMS,
             'term': f"{name} {artist} {album}" if album else f"{name} {artist}",
-            'types': 'activities,albums,apple-curators,artists,curators,editorial-items,music-movies,music-videos,playlists,record-labels,songs,stations,tv-episodes,uploaded-videos',
-            'with': 'lyricHighlights,lyrics,serverBubbles'
         }
         
         async with self.session.get(url=url, headers=self.headers, params=params) as response:
             if response.status == 200:
-                data = await response.json()
+                data = _json_loads(await response.read())
                 results = []
                 if 'resources' in data and 'songs' in data['resources']:
                     songs = data['resources']['songs']
@@ -437,15 +467,20 @@ class AppleMusicAPI:
                     # 创建一个缓存，用于存储已获取的歌词
                     self.ttml_lyric_cache = {}
                     
-                    # 预先获取所有歌词
+                    # 收集需要额外请求的歌词路径（去重）
+                    lyric_paths = set()
                     for song_id, song_data in songs.items():
                         if song_data['type'] == 'songs':
                             syllable_lyrics = song_data.get('relationships', {}).get('syllable-lyrics', {})
                             lyric_path = syllable_lyrics.get('href', '')
                             if lyric_path and not syllable_lyrics.get('data'):
-                                ttml = await self.get_lyric(lyric_path)
-                                self.ttml_lyric_cache[lyric_path] = ttml
-                    
+                                lyric_paths.add(lyric_path)
+
+                    # 并发获取所有歌词，并发数由get_lyric内的实例信号量限制
+                    lyric_paths = list(lyric_paths)
+                    ttmls = await asyncio.gather(*(self.get_lyric(p) for p in lyric_paths))
+                    self.ttml_lyric_cache = dict(zip(lyric_paths, ttmls))
+
                     for song_id, song_data in songs.items():
                         if song_data['type'] == 'songs':
                             source_data: dict = self.data_parser_song(song_data)
@@ -453,9 +488,9 @@ class AppleMusicAPI:
                 return results
             return []
         
-    async def get_album(self, album_id: str, get_all: bool = False) -> dict:
+    async def _fetch_album(self, album_id: str) -> dict:
         """
-        获取专辑数据
+        获取专辑原始数据
         """
         await self.ensure_session()
         url = f"https://amp-api.music.apple.com/v1/catalog/us/albums/{album_id}"
@@ -464,24 +499,31 @@ class AppleMusicAPI:
             "relate[albums]": "artists",
         }
         
-        async with self.session.get(url=url, headers=self.headers, params=params) as response:
+        async with self._semaphore, self.session.get(url=url, headers=self.headers, params=params) as response:
             if response.status == 200:
-                data = await response.json()
+                data = _json_loads(await response.read())
                 if len(data.get('data', [])) > 0:
-                    if get_all:
-                        return data.get('data', [])[0]
-                    else:
-                        return self.data_parser_album(data.get('data', [])[0])
+                    return data.get('data', [])[0]
                 else:
                     logger.error(f"获取专辑数据失败: 响应中无有效数据, ID: {album_id}")
                     return {}
             else:
                 logger.error(f"获取专辑数据失败: HTTP状态码 {response.status}, ID: {album_id}")
                 return {}
-        
-    async def get_artist(self, artist_id: str, get_all: bool = False) -> dict:
+
+    async def get_album(self, album_id: str, get_all: bool = False) -> dict:
         """
-        获取艺术家数据
+        获取专辑数据
+        :return: get_all为True时返回原始数据，否则返回整理后的专辑数据，失败时返回空字典
+        """
+        album_data = await self._fetch_album(album_id)
+        if not album_data or get_all:
+            return album_data
+        return self.data_parser_album(album_data)
+
+    async def _fetch_artist(self, artist_id: str) -> dict:
+        """
+        获取艺术家原始数据
         """
         await self.ensure_session()
         url = f"https://amp-api.music.apple.com/v1/catalog/us/artists/{artist_id}"
@@ -489,24 +531,40 @@ class AppleMusicAPI:
             "l": "zh-Hans-CN",
         }
         
-        async with self.session.get(url=url, headers=self.headers, params=params) as response:
+        async with self._semaphore, self.session.get(url=url, headers=self.headers, params=params) as response:
             if response.status == 200:
-                data = await response.json()
+                data = _json_loads(await response.read())
                 if len(data.get('data', [])) > 0:
-                    if get_all:
-                        return data.get('data', [])[0]
-                    else:
-                        return self.data_parser_artist(data.get('data', [])[0])
+                    return data.get('data', [])[0]
                 else:
                     logger.error(f"获取艺术家数据失败: 响应中无有效数据, ID: {artist_id}")
                     return {}
             else:
                 logger.error(f"获取艺术家数据失败: HTTP状态码 {response.status}, ID: {artist_id}")
                 return {}
-        
-    async def get_song(self, song_id: str) -> dict:
+
+    async def get_artist(self, artist_id: str, get_all: bool = False) -> dict:
         """
-        获取歌曲数据
+        获取艺术家数据
+        :return: get_all为True时返回原始数据，否则返回整理后的艺术家数据，失败时返回空字典
+        """
+        artist_data = await self._fetch_artist(artist_id)
+        if not artist_data or get_all:
+            return artist_data
+        return self.data_parser_artist(artist_data)
+
+    @staticmethod
+    def _missing_lyric_path(song_data: dict) -> str:
+        """返回需要额外请求的歌词路径，歌词已内嵌时返回空字符串"""
+        syllable_lyrics = song_data.get('relationships', {}).get('syllable-lyrics', {})
+        lyric_path = syllable_lyrics.get('href', '')
+        if lyric_path and not syllable_lyrics.get('data'):
+            return lyric_path
+        return ''
+
+    async def _fetch_song(self, song_id: str) -> dict:
+        """
+        获取歌曲原始数据（不含额外请求的歌词）
         """
         await self.ensure_session()
         url = f"https://amp-api.music.apple.com/v1/catalog/us/songs/{song_id}"
@@ -519,29 +577,38 @@ class AppleMusicAPI:
             "relate[songs]": "artists,lyrics,syllable-lyrics",
         }
         
-        async with self.session.get(url=url, headers=self.headers, params=params) as response:
+        async with self._semaphore, self.session.get(url=url, headers=self.headers, params=params) as response:
             if response.status == 200:
-                data = await response.json()
+                data = _json_loads(await response.read())
                 if len(data.get('data', [])) > 0:
-                    # 获取歌词
-                    song_data = data.get('data', [])[0]
-                    syllable_lyrics = song_data.get('relationships', {}).get('syllable-lyrics', {})
-                    lyric_path = syllable_lyrics.get('href', '')
-                    if lyric_path and not syllable_lyrics.get('data'):
-                        # 创建一个临时缓存
-                        self.ttml_lyric_cache = {}
-                        ttml = await self.get_lyric(lyric_path)
-                        self.ttml_lyric_cache[lyric_path] = ttml
-                    else:
-                        self.ttml_lyric_cache = {}
-                        
-                    return self.data_parser_song(song_data)
+                    return data.get('data', [])[0]
                 else:
                     logger.error(f"获取歌曲数据失败: 响应中无有效数据, ID: {song_id}")
                     return {}
             else:
                 logger.error(f"获取歌曲数据失败: HTTP状态码 {response.status}, ID: {song_id}")
                 return {}
+
+    async def get_song(self, song_id: str, lyric_ttml: Optional[str] = None, parse_lyrics: bool = True) -> dict:
+        """
+        获取歌曲数据
+        :param song_id: 歌曲ID
+        :param lyric_ttml: 预先获取的TTML歌词，为None时按需请求
+        :param parse_lyrics: 是否将TTML歌词转换为LRC
+        """
+        song_data = await self._fetch_song(song_id)
+        if not song_data:
+            return {}
+
+        # 创建一个临时缓存
+        self.ttml_lyric_cache = {}
+        lyric_path = self._missing_lyric_path(song_data)
+        if lyric_path:
+            if lyric_ttml is None:
+                lyric_ttml = await self.get_lyric(lyric_path)
+            self.ttml_lyric_cache[lyric_path] = lyric_ttml
+
+        return self.data_parser_song(song_data, parse_lyrics=parse_lyrics)
             
     async def search_api(self, keyword: str):
         """
@@ -549,30 +616,10 @@ class AppleMusicAPI:
         """
         await self.ensure_session()
         url = "https://amp-api-edge.music.apple.com/v1/catalog/us/search"
-        search_params = {
-            'art[music-videos:url]': 'c',
-            'art[url]': 'f',
-            'extend': 'artistUrl',
-            'relate[albums]': 'artists',
-            'fields[artists]': 'url,name,artwork',
-            'format[resources]': 'map',
-            'include[albums]': 'artists',
-            'include[music-videos]': 'artists',
-            'include[songs]': 'artists',
-            'include[stations]': 'radio-show',
-            'l': 'zh-Hans-CN',
-            'limit': '21',
-            'omit[resource]': 'autos',
-            'platform': 'web',
-            'relate[albums]': 'artists',
-            'relate[songs]': 'albums',
-            'term': keyword,
-            'types': 'activities,albums,apple-curators,artists,curators,editorial-items,music-movies,music-videos,playlists,record-labels,songs,stations,tv-episodes,uploaded-videos',
-            'with': 'lyricHighlights,lyrics,serverBubbles'
-        }
+        search_params = {**_SEARCH_PARAMS, 'term': keyword}
         async with self.session.get(url=url, headers=self.headers, params=search_params) as response:
             if response.status == 200:
-                data = await response.json()
+                data = _json_loads(await response.read())
                 return data
             else:
                 logger.error(f"搜索API失败: HTTP状态码 {response.status}")
@@ -610,13 +657,14 @@ class AppleMusicAPI:
                 return []
             
             type_handlers = {
-                "songs": (self.get_song, results.append),
-                "albums": (self.get_album, results.append),
-                "artists": (self.get_artist, results.append)
+                "songs": (self._fetch_song, self.data_parser_song),
+                "albums": (self._fetch_album, self.data_parser_album),
+                "artists": (self._fetch_artist, self.data_parser_artist)
             }
             
-            # 分别异步获取所有条目的详细信息
+            # 第一轮：分别异步获取所有条目的原始数据
             tasks = []
+            item_types = []
             for item in top:
                 item_type = item.get('type')
                 item_id = item.get('id')
@@ -627,8 +675,9 @@ class AppleMusicAPI:
                     
                 handler = type_handlers.get(item_type)
                 if handler:
-                    get_method, _ = handler
-                    tasks.append(get_method(item_id))
+                    fetch_method, _ = handler
+                    tasks.append(fetch_method(item_id))
+                    item_types.append(item_type)
                 else:
                     logger.debug(f"未处理的项目类型: {item_type}")
             
@@ -637,10 +686,24 @@ class AppleMusicAPI:
                 return []
             
             # 等待所有任务完成
-            results_data = await asyncio.gather(*tasks)
+            raw_data = await asyncio.gather(*tasks)
             
-            # 筛选掉空结果并存入数据库
-            for result in results_data:
+            # 第二轮：并发获取所有歌曲缺失的歌词
+            lyric_paths = list({
+                lyric_path
+                for item_type, item_data in zip(item_types, raw_data)
+                if item_data and item_type == 'songs'
+                and (lyric_path := self._missing_lyric_path(item_data))
+            })
+            ttmls = await asyncio.gather(*(self.get_lyric(p) for p in lyric_paths))
+            self.ttml_lyric_cache = dict(zip(lyric_paths, ttmls))
+            
+            # 本地解析并筛选掉空结果
+            for item_type, item_data in zip(item_types, raw_data):
+                if not item_data:
+                    continue
+                _, parser = type_handlers[item_type]
+                result = parser(item_data)
                 if result:  # 非空
                     try:
                         results.append(result)
@@ -662,10 +725,10 @@ class AppleMusicAPI:
         获取播放列表数据
         """
         await self.ensure_session()
-        url = f"https://amp-api.music.apple.com/v1/catalog/us/playlists/{playlist_id}?art%5Burl%5D=f&extend=editorialArtwork%2CeditorialVideo%2Coffers%2CseoDescription%2CseoTitle%2CtrackCount&fields%5Balbums%5D=name%2Cartwork%2CplayParams%2Curl&fields%5Bapple-curators%5D=name%2Curl&fields%5Bartists%5D=name%2Cartwork%2Curl&fields%5Bcurators%5D=name%2Curl&fields%5Bsongs%5D=name%2CartistName%2CcuratorName%2CcomposerName%2Cartwork%2CplayParams%2CcontentRating%2CalbumName%2Curl%2CdurationInMillis%2CaudioTraits%2CextendedAssetUrls&format%5Bresources%5D=map&include=tracks%2Ccurator&include%5Bmusic-videos%5D=artists&include%5Bsongs%5D=artists&l=zh-Hans-CN&limit%5Btracks%5D=300&limit%5Bview.featured-artists%5D=15&limit%5Bview.more-by-curator%5D=15&omit%5Bresource%5D=autos&platform=web&views=featured-artists%2Cmore-by-curator"
+        url = f"https://amp-api.music.apple.com/v1/catalog/us/playlists/{playlist_id}?{_PLAYLIST_QUERY}"
         async with self.session.get(url=url, headers=self.headers) as response:
             if response.status == 200:
-                data = await response.json()
+                data = _json_loads(await response.read())
                 return data
             else:
                 logger.error(f"获取播放列表数据失败: HTTP状态码 {response.status}")